@@ -7,10 +7,61 @@ activity metrics for the session to help decide if posts should be generated.
 """
 
 import json
+import mmap
 import sys
 import os
+from collections import deque
 from pathlib import Path
 
+try:
+    # Optional fast JSON parser for the transcript tail; stdlib json is
+    # the fallback so the hook never gains a hard dependency.
+    import orjson as _json
+except ImportError:
+    _json = json
+
+
+def _dumps(obj):
+    """Serialize to compact JSON bytes with whichever parser is loaded.
+
+    orjson emits bytes directly; the stdlib fallback gets compact
+    separators so the delta records stay one small write either way.
+    """
+    if _json is json:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    return _json.dumps(obj)
+
+
+def _tail_lines(filepath, maxlen=20):
+    """Return the last maxlen lines of a file as bytes.
+
+    Memory-maps the file and walks newlines backwards from the end, so
+    only the tail pages of a multi-MB transcript are ever touched -
+    the equivalent of tail -n. Falls back to streaming the file into a
+    bounded deque when it can't be mapped (e.g. empty file).
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return list(deque(f, maxlen=maxlen))
+        try:
+            size = len(mm)
+            # A trailing newline terminates the last line; don't count it
+            pos = size - 1 if mm[size - 1] == 0x0A else size
+            newlines = 0
+            while newlines < maxlen:
+                nl = mm.rfind(b'\n', 0, pos)
+                if nl < 0:
+                    pos = -1
+                    break
+                newlines += 1
+                pos = nl
+            start = pos + 1
+            return mm[start:].splitlines()
+        finally:
+            mm.close()
+
 
 def main():
     # Read hook input from stdin
@@ -23,63 +74,61 @@ def main():
     plugin_root = os.environ.get('CLAUDE_PLUGIN_ROOT', '')
     if not plugin_root:
         sys.exit(0)
-    
-    activity_file = Path(plugin_root) / '.session_activity.json'
-    
-    # Load existing activity or create new
-    if activity_file.exists():
-        try:
-            with open(activity_file, 'r') as f:
-                activity = json.load(f)
-        except:
-            activity = {}
-    else:
-        activity = {
-            'files_modified': 0,
-            'files_created': 0,
-            'git_commits': 0,
-            'commands_run': 0,
-            'responses': 0
-        }
-    
-    # Increment response counter
-    activity['responses'] = activity.get('responses', 0) + 1
-    
+
+    activity_file = Path(plugin_root) / '.session_activity.log'
+
+    # This hook fires after every response, so instead of a full
+    # read-modify-write of an aggregate JSON file each time, we append
+    # one delta record per event and let the session end hook sum them.
+    activity = {
+        'files_modified': 0,
+        'files_created': 0,
+        'git_commits': 0,
+        'commands_run': 0,
+        'responses': 1
+    }
+
     # Check the session transcript for recent activity if available
     transcript_path = hook_data.get('transcript_path', '')
     if transcript_path and os.path.exists(transcript_path):
         try:
-            # Read last few lines of transcript for recent activity
-            with open(transcript_path, 'r') as f:
-                lines = f.readlines()
-            
+            # Read only the transcript tail - constant memory and I/O
+            # no matter how long the session gets
+            tail = _tail_lines(transcript_path, maxlen=20)
+
             # Check recent messages for file operations
-            for line in lines[-20:]:  # Check last 20 messages
+            for line in tail:  # Check last 20 messages
+                # Schema-aware prefilter: this loop only reads tool
+                # names, so lines whose raw bytes can't carry one skip
+                # the full JSON decode and dict build entirely
+                if b'"name"' not in line and b'"tool_name"' not in line:
+                    continue
                 try:
-                    msg = json.loads(line)
+                    msg = _json.loads(line)
                     tool_name = msg.get('name', msg.get('tool_name', ''))
                     
                     if tool_name in ('Write', 'create_file'):
-                        activity['files_created'] = activity.get('files_created', 0) + 1
+                        activity['files_created'] += 1
                     elif tool_name in ('Edit', 'MultiEdit', 'str_replace'):
-                        activity['files_modified'] = activity.get('files_modified', 0) + 1
+                        activity['files_modified'] += 1
                     elif tool_name == 'Bash':
-                        activity['commands_run'] = activity.get('commands_run', 0) + 1
+                        activity['commands_run'] += 1
                         command = msg.get('tool_input', {}).get('command', '')
                         if 'git commit' in command:
-                            activity['git_commits'] = activity.get('git_commits', 0) + 1
+                            activity['git_commits'] += 1
                 except:
                     continue
         except:
             pass
-    
-    # Save activity log
+
+    # Append this event's delta - a single small write instead of
+    # rereading and rewriting the whole activity file per response
     try:
-        with open(activity_file, 'w') as f:
-            json.dump(activity, f)
+        with open(activity_file, 'ab') as f:
+            f.write(_dumps(activity) + b'\n')
     except:
         pass
-    
+
     sys.exit(0)
 
 
@@ -16,11 +16,146 @@ import sys
 import os
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any, Set
+from typing import Optional, Tuple, List, Dict, Any, Set, Iterable, Iterator
 from dataclasses import dataclass, field
 
+try:
+    # Optional: C-level JSON parser, 2-5x faster on big transcripts.
+    # The plugin stays stdlib-only - this is purely opportunistic.
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Compiled once at import - these run per Bash tool use, and re.search
+# with a pattern string pays a cache lookup on every call.
+_HEREDOC_MSG_RE = re.compile(r"<<'?EOF'?\s*\n(.+?)\n", re.DOTALL)
+_COMMIT_MSG_RE = re.compile(r'-m ["\'](.+?)["\']')
+
+# One alternation pattern instead of seven separate substring scans per
+# Bash command - a single linear pass finds commits and test runs.
+# Word boundaries keep e.g. 'majesty' from registering as a jest run.
+_CMD_EVENT_RE = re.compile(r'\b(?:git commit|pytest|jest|npm test|cargo test|go test|rspec)\b')
+
+# Error-fix detection without lowercasing whole assistant messages -
+# the regex engine scans case-insensitively with no string copy.
+_ERROR_RE = re.compile(r'error', re.IGNORECASE)
+_FIXED_RE = re.compile(r'fixed|resolved', re.IGNORECASE)
+
+# datetime.fromisoformat accepts a trailing 'Z' natively from 3.11 on
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+
+def _parse_ts(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, tolerating a trailing 'Z'.
+
+    Only pays for the .replace() copy on Pythons older than 3.11.
+    """
+    if not _FROMISO_HANDLES_Z:
+        timestamp = timestamp.replace('Z', '+00:00')
+    return datetime.fromisoformat(timestamp)
+
+# Tool names checked once per tool_use event - frozensets give a single
+# hash probe instead of scanning a tuple rebuilt per call
+_WRITE_TOOLS = frozenset({'Write', 'create_file'})
+_EDIT_TOOLS = frozenset({'Edit', 'MultiEdit', 'str_replace'})
+_FILE_TOOLS = _WRITE_TOOLS | _EDIT_TOOLS
+
+# Language detection patterns
+_LANG_EXTENSIONS = {
+    '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
+    '.jsx': 'React', '.tsx': 'React/TypeScript', '.go': 'Go',
+    '.rs': 'Rust', '.rb': 'Ruby', '.java': 'Java', '.cpp': 'C++',
+    '.c': 'C', '.swift': 'Swift', '.kt': 'Kotlin', '.sql': 'SQL',
+    '.html': 'HTML', '.css': 'CSS', '.scss': 'SCSS', '.vue': 'Vue',
+    '.svelte': 'Svelte', '.md': 'Markdown', '.json': 'JSON',
+    '.yaml': 'YAML', '.yml': 'YAML', '.sh': 'Bash', '.dockerfile': 'Docker'
+}
+# Cheap C-level gate for paths with no known extension
+_KNOWN_EXTS = tuple(_LANG_EXTENSIONS)
+
+_CATEGORY_EMOJI = {
+    'feature': '✨', 'fix': '🐛', 'test': '🧪',
+    'milestone': '🎯', 'refactor': '♻️', 'docs': '📚'
+}
+
+# Strips '/' and ' ' from language names when building hashtags -
+# one C-level translate pass instead of chained .replace copies
+_HASHTAG_TRANS = str.maketrans('', '', '/ ')
+
+# Style presets as data. generate_posts picks one template dict per
+# call and renders, instead of re-branching on the style inside every
+# section. 'minimal' and 'ship' share the default (non-devlog) thread
+# hooks, mirroring the old branching.
+_TWITTER_TEMPLATES = {
+    'devlog': {
+        'ship': 'devlog: shipped {msg}',
+        'files': 'devlog: added {n} {noun}',
+        'bugs': 'devlog: fixed {n} {noun}',
+        'time': 'devlog: {t} in the trenches ({ops} ops)',
+        'hook_commit': "devlog: Just shipped {msg}\n\nHere's what went into this 🧵",
+        'hook_files': 'devlog: Created {n} new files today\n\n{langs} - building in public 🧵',
+        'hook_bugs': "devlog: Squashed {n} bugs in today's session\n\nThe debugging journey 🧵",
+        'hook_stack': 'devlog: {t} deep in {langs}\n\nSession recap 🧵',
+        'hook_fallback': 'devlog: Working on {project}\n\nProgress update 🧵',
+    },
+    'minimal': {
+        'ship': 'Shipped: {msg}',
+        'files': 'Created {n} {noun}',
+        'bugs': 'Fixed {n} {noun}',
+        'time': '{t} of focused coding ({ops} ops)',
+        'hook_commit': 'Just shipped: {msg}\n\nThread on how it came together 👇',
+        'hook_files': 'Built {n} new files today in {langs}\n\nBreakdown 👇',
+        'hook_bugs': 'Fixed {n} bugs today\n\nWhat I learned 👇',
+        'hook_stack': '{t} building with {langs}\n\nWhat I shipped 👇',
+        'hook_fallback': 'Quick session on {project}\n\nWhat changed 👇',
+    },
+    'ship': {
+        'ship': '✅ Just shipped: {msg}',
+        'files': '🛠️ Coding session complete!\n\nCreated {n} {noun} today.',
+        'bugs': '🐛➡️✅ Squashed {n} {noun} today!\n\nThe best feeling in coding.',
+        'time': '⏱️ {t} of focused coding\n\n{ops} operations later... progress!',
+        'hook_commit': 'Just shipped: {msg}\n\nThread on how it came together 👇',
+        'hook_files': 'Built {n} new files today in {langs}\n\nBreakdown 👇',
+        'hook_bugs': 'Fixed {n} bugs today\n\nWhat I learned 👇',
+        'hook_stack': '{t} building with {langs}\n\nWhat I shipped 👇',
+        'hook_fallback': 'Quick session on {project}\n\nWhat changed 👇',
+    },
+}
+
+_LINKEDIN_TEMPLATES = {
+    'professional': {
+        'headlines': [
+            'Build update',
+            'Progress update',
+            'Product update',
+            'Engineering update',
+        ],
+        'body': ('{headline}\n\n{intro}\n\nKey outcomes:\n{bullets}\n\n'
+                 'What are you building this week?\n\n{hashtags}'),
+    },
+    'story': {
+        'headlines': [
+            'A small win (and a lesson)',
+            'A quick story from today’s build',
+            'One of those satisfying sessions',
+        ],
+        'body': ('{headline}\n\n{intro}\n\nWhat changed:\n{bullets}\n\n'
+                 'Curious what you’re building right now — what’s on your plate this week?\n\n{hashtags}'),
+    },
+    'wins': {
+        'headlines': [
+            'Progress, in numbers',
+            'Session snapshot',
+            'Quick status update',
+        ],
+        'body': '{headline}\n\n{intro}\n\nHighlights:\n{bullets}\n\n{hashtags}',
+    },
+}
+
 
 @dataclass
 class SessionHighlight:
@@ -48,10 +183,25 @@ class SessionSummary:
     languages_used: set = field(default_factory=set)
 
 
+@lru_cache(maxsize=4096)
+def _ext(name: str) -> str:
+    """Lowercased extension of a basename, '' if it has none.
+
+    Follows pathlib's suffix rules (dotfiles have no extension) without
+    paying for a PurePath construction per call.
+    """
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ''
+
+
+@lru_cache(maxsize=4096)
 def safe_display_path(raw_path: str) -> str:
     """
     Privacy-safe display value for a path.
 
+    Cached: sessions hammer the same handful of paths across hundreds
+    of Edit events, so repeats collapse to one dict lookup.
+
     Claude transcripts often contain absolute paths (e.g. /Users/<name>/...).
     For content meant to be shared publicly, we only keep the basename.
     """
@@ -106,85 +256,132 @@ def find_claude_projects_dir() -> Path:
     raise FileNotFoundError(f"Claude projects directory not found at {claude_dir}")
 
 
+def _latest_session_in(project_path: str) -> Optional[Tuple[float, str]]:
+    """Return (mtime, path) of the newest session JSONL in one project dir.
+
+    os.scandir hands back DirEntry objects whose stat info is cached
+    from the directory read, so there's no extra stat() syscall per
+    file and no Path construction in the scan loop.
+    """
+    try:
+        session_entries = os.scandir(project_path)
+    except OSError:
+        return None
+    latest = None
+    with session_entries:
+        for entry in session_entries:
+            if entry.name.endswith('.jsonl') and entry.is_file(follow_symlinks=False):
+                mtime = entry.stat().st_mtime
+                if latest is None or mtime > latest[0]:
+                    latest = (mtime, entry.path)
+    return latest
+
+
 def get_latest_session(project_dir: Optional[Path] = None) -> Tuple[Path, str]:
     """Find the most recently modified session JSONL file"""
     projects_dir = find_claude_projects_dir()
-    
-    latest_file = None
-    latest_mtime = 0
-    
-    for project_path in projects_dir.iterdir():
-        if not project_path.is_dir():
-            continue
-        for session_file in project_path.glob("*.jsonl"):
-            mtime = session_file.stat().st_mtime
-            if mtime > latest_mtime:
-                latest_mtime = mtime
-                latest_file = session_file
-    
-    if latest_file is None:
+
+    project_paths = [
+        entry.path for entry in os.scandir(projects_dir)
+        if entry.is_dir(follow_symlinks=False)
+    ]
+
+    # The scan is bound by stat/getdents latency, not CPU - threads
+    # overlap the syscalls (the GIL is released during I/O), which pays
+    # off on cold caches with many project directories.
+    latest = None
+    if project_paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(project_paths))) as executor:
+            for result in executor.map(_latest_session_in, project_paths):
+                if result is not None and (latest is None or result[0] > latest[0]):
+                    latest = result
+
+    if latest is None:
         raise FileNotFoundError("No session files found")
-    
-    # Extract project name from path
+
+    # Only the single winner gets wrapped in a Path
+    latest_file = Path(latest[1])
     project_dir_name = latest_file.parent.name
     return latest_file, project_dir_name
 
 
-def parse_session_jsonl(filepath: Path) -> List[Dict[str, Any]]:
-    """Parse a Claude Code session JSONL file"""
-    messages = []
-    with open(filepath, 'r', encoding='utf-8') as f:
+def _list_all_sessions() -> List[Tuple[str, str]]:
+    """Return (path, project_dir_name) for every session JSONL file."""
+    projects_dir = find_claude_projects_dir()
+    sessions = []
+    for project_entry in os.scandir(projects_dir):
+        if not project_entry.is_dir(follow_symlinks=False):
+            continue
+        try:
+            session_entries = os.scandir(project_entry.path)
+        except OSError:
+            continue
+        with session_entries:
+            for entry in session_entries:
+                if entry.name.endswith('.jsonl') and entry.is_file(follow_symlinks=False):
+                    sessions.append((entry.path, project_entry.name))
+    return sessions
+
+
+def iter_session_jsonl(filepath: Path) -> Iterator[Dict[str, Any]]:
+    """Stream messages from a Claude Code session JSONL file.
+
+    Yields one decoded message at a time so large transcripts can be
+    processed with constant memory instead of materializing a full list.
+
+    The file is read in binary so the parser (orjson when available)
+    works on raw bytes without a per-line str decode.
+    """
+    with open(filepath, 'rb', buffering=1 << 20) as f:
         for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    messages.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-    return messages
+            if line.isspace():
+                continue
+            try:
+                yield _json.loads(line)
+            except ValueError:
+                continue
 
 
-def extract_highlights(messages: List[Dict[str, Any]]) -> SessionSummary:
+def extract_highlights(messages: Iterable[Dict[str, Any]]) -> SessionSummary:
     """Extract notable events and statistics from session messages"""
     highlights: List[SessionHighlight] = []
-    files_created = set()
-    files_modified = set()
+    # One insertion-ordered map for all touched files: bit 1 = created
+    # (Write-style tools), bit 2 = modified (Edit-style). One hash
+    # table and one probe per file event instead of two separate sets,
+    # and output order stays deterministic (first touched, first listed)
+    file_state: Dict[str, int] = {}
     git_commits = []
     errors_fixed = 0
     tests_run = False
     total_tool_calls = 0
     languages_used = set()
     
-    # Language detection patterns
-    lang_extensions = {
-        '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-        '.jsx': 'React', '.tsx': 'React/TypeScript', '.go': 'Go',
-        '.rs': 'Rust', '.rb': 'Ruby', '.java': 'Java', '.cpp': 'C++',
-        '.c': 'C', '.swift': 'Swift', '.kt': 'Kotlin', '.sql': 'SQL',
-        '.html': 'HTML', '.css': 'CSS', '.scss': 'SCSS', '.vue': 'Vue',
-        '.svelte': 'Svelte', '.md': 'Markdown', '.json': 'JSON',
-        '.yaml': 'YAML', '.yml': 'YAML', '.sh': 'Bash', '.dockerfile': 'Docker'
-    }
-    
     first_timestamp = None
     last_timestamp = None
-    
+
+    # Bind hot lookups once - these run per message/tool use and the
+    # repeated LOAD_ATTR/LOAD_GLOBAL work adds up on long transcripts.
+    file_state_get = file_state.get
+    languages_add = languages_used.add
+
     for msg in messages:
-        # Track timestamps
-        if 'timestamp' in msg:
-            ts = msg['timestamp']
+        mtype = msg.get('type')
+
+        # Track timestamps - one dict probe instead of membership + index
+        ts = msg.get('timestamp')
+        if ts:
             if first_timestamp is None:
                 first_timestamp = ts
             last_timestamp = ts
 
         # Extract tool uses from message content (Claude Code format)
         tool_uses = []
-        if msg.get('type') == 'assistant' and 'message' in msg:
+        if mtype == 'assistant' and 'message' in msg:
             # Claude Code JSONL format: tool_use inside message.content[]
             content = msg['message'].get('content', [])
             if isinstance(content, list):
                 tool_uses = [item for item in content if isinstance(item, dict) and item.get('type') == 'tool_use']
-        elif msg.get('type') == 'tool_use':
+        elif mtype == 'tool_use':
             # Direct tool_use format (fallback)
             tool_uses = [msg]
 
@@ -195,60 +392,71 @@ def extract_highlights(messages: List[Dict[str, Any]]) -> SessionSummary:
             tool_input = tool_use.get('input', {})
             
             # File operations
-            if tool_name in ('Write', 'Edit', 'MultiEdit', 'create_file', 'str_replace'):
+            if tool_name in _FILE_TOOLS:
                 file_path = tool_input.get('file_path', tool_input.get('path', ''))
                 if file_path:
                     safe_path = safe_display_path(file_path)
-                    ext = Path(safe_path).suffix.lower()
-                    if ext in lang_extensions:
-                        languages_used.add(lang_extensions[ext])
+                    # Lowercase once, then a tuple endswith (single C
+                    # call, short-circuiting) filters out paths with no
+                    # known extension before the slice and dict lookup
+                    lowered = safe_path.lower()
+                    if lowered.endswith(_KNOWN_EXTS):
+                        lang = _LANG_EXTENSIONS.get(_ext(lowered))
+                        if lang:
+                            languages_add(lang)
                     
-                    if tool_name in ('Write', 'create_file'):
-                        files_created.add(safe_path)
-                    else:
-                        files_modified.add(safe_path)
+                    flag = 1 if tool_name in _WRITE_TOOLS else 2
+                    file_state[safe_path] = file_state_get(safe_path, 0) | flag
             
             # Bash commands
             elif tool_name == 'Bash':
                 command = tool_input.get('command', '')
 
+                saw_commit = False
+                for match in _CMD_EVENT_RE.finditer(command):
+                    if match.group(0) == 'git commit':
+                        saw_commit = True
+                    else:
+                        tests_run = True
+
                 # Git commits
-                if 'git commit' in command:
+                if saw_commit:
                     # Try heredoc format first: git commit -m "$(cat <<'EOF' ... EOF)"
-                    heredoc_match = re.search(r"<<'?EOF'?\s*\n(.+?)\n", command, re.DOTALL)
+                    heredoc_match = _HEREDOC_MSG_RE.search(command)
                     if heredoc_match:
                         # Extract first line of commit message from heredoc
                         commit_msg = heredoc_match.group(1).strip().split('\n')[0]
                         git_commits.append(commit_msg)
                     else:
                         # Fallback to simple -m "message" format
-                        commit_match = re.search(r'-m ["\'](.+?)["\']', command)
+                        commit_match = _COMMIT_MSG_RE.search(command)
                         if commit_match:
                             git_commits.append(commit_match.group(1))
-                
-                # Test runs
-                if any(t in command for t in ['pytest', 'jest', 'npm test', 'cargo test', 'go test', 'rspec']):
-                    tests_run = True
         
         # Process assistant messages for context
-        if msg.get('type') == 'assistant' or msg.get('role') == 'assistant':
+        if mtype == 'assistant' or msg.get('role') == 'assistant':
             content = msg.get('content', '')
-            if isinstance(content, list):
-                content = ' '.join(str(c.get('text', '')) for c in content if isinstance(c, dict))
-            
-            content_lower = content.lower() if isinstance(content, str) else ''
-            
-            if 'error' in content_lower and ('fixed' in content_lower or 'resolved' in content_lower):
+            if type(content) is list:
+                # Join only real text blocks - the values are already str,
+                # so the old str() wrap per chunk was pure overhead
+                # List comprehension, not a genexp: join materializes its
+                # argument anyway, and LIST_APPEND beats generator frames
+                content = ' '.join([c['text'] for c in content if type(c) is dict and isinstance(c.get('text'), str)])
+
+            if content and isinstance(content, str) and _ERROR_RE.search(content) and _FIXED_RE.search(content):
                 errors_fixed += 1
     
+    files_created = [path for path, state in file_state.items() if state & 1]
+    files_modified = [path for path, state in file_state.items() if state & 2]
+
     # Calculate duration
     duration_minutes = 0
     if first_timestamp and last_timestamp:
         try:
             # Try to parse ISO format timestamps
             if isinstance(first_timestamp, str):
-                first_dt = datetime.fromisoformat(first_timestamp.replace('Z', '+00:00'))
-                last_dt = datetime.fromisoformat(last_timestamp.replace('Z', '+00:00'))
+                first_dt = _parse_ts(first_timestamp)
+                last_dt = _parse_ts(last_timestamp)
                 duration_minutes = int((last_dt - first_dt).total_seconds() / 60)
         except (ValueError, TypeError):
             pass
@@ -258,7 +466,7 @@ def extract_highlights(messages: List[Dict[str, Any]]) -> SessionSummary:
         highlights.append(SessionHighlight(
             category='feature',
             description=f"Created {len(files_created)} new file(s)",
-            files_involved=list(files_created)[:5]
+            files_involved=files_created[:5]
         ))
     
     if git_commits:
@@ -285,8 +493,8 @@ def extract_highlights(messages: List[Dict[str, Any]]) -> SessionSummary:
         project_name="",
         duration_minutes=duration_minutes,
         highlights=highlights,
-        files_created=list(files_created),
-        files_modified=list(files_modified),
+        files_created=files_created,
+        files_modified=files_modified,
         tests_run=tests_run,
         git_commits=git_commits,
         errors_fixed=errors_fixed,
@@ -312,10 +520,13 @@ def generate_posts(
     twitter_style = (twitter_style or "devlog").strip().lower()
     linkedin_style = (linkedin_style or "professional").strip().lower()
 
+    # Sort once - half a dozen sections below slice this
+    sorted_langs = sorted(summary.languages_used)
+
     # Generate hashtags
     hashtags = ['#BuildingInPublic', '#CodingInPublic']
-    for lang in sorted(list(summary.languages_used))[:3]:
-        hashtags.append(f'#{lang.replace("/", "").replace(" ", "")}')
+    for lang in sorted_langs[:3]:
+        hashtags.append(f'#{lang.translate(_HASHTAG_TRANS)}')
     if summary.tests_run:
         hashtags.append('#TDD')
     posts['hashtags'] = hashtags
@@ -332,55 +543,27 @@ def generate_posts(
         mins = minutes % 60
         return f"{hours}h {mins}m" if hours else f"{mins} minutes"
 
-    # Platform-specific hashtag handling
-    # X/Twitter: No hashtags (per Elon's guidance - they look spammy)
-    # Other platforms: Include hashtags
-    hashtag_str_x = ''  # No hashtags for X/Twitter
-    hashtag_str_other = ' '.join(hashtags[:4])  # For BlueSky, LinkedIn, etc.
+    # Resolve each platform's template set once; unknown styles fall
+    # back the same way the old else-branches did
+    tw_tpl = _TWITTER_TEMPLATES.get(twitter_style, _TWITTER_TEMPLATES['ship'])
 
     # Short posts (Twitter/X - NO hashtags per Elon's guidance)
     if summary.git_commits:
-        commit_msg = summary.git_commits[0][:80]
-        if twitter_style == "devlog":
-            posts['short'].append(f"devlog: shipped {commit_msg}")
-        elif twitter_style == "minimal":
-            posts['short'].append(f"Shipped: {commit_msg}")
-        else:  # ship
-            posts['short'].append(f"✅ Just shipped: {commit_msg}")
+        posts['short'].append(tw_tpl['ship'].format(msg=summary.git_commits[0][:80]))
 
     if summary.files_created:
         count = len(summary.files_created)
-        if twitter_style == "devlog":
-            posts['short'].append(f"devlog: added {count} {_plural(count, 'new file')}")
-        elif twitter_style == "minimal":
-            posts['short'].append(f"Created {count} {_plural(count, 'new file')}")
-        else:
-            posts['short'].append(
-                f"🛠️ Coding session complete!\n\nCreated {count} new file{'s' if count > 1 else ''} today."
-            )
+        posts['short'].append(tw_tpl['files'].format(n=count, noun=_plural(count, 'new file')))
 
     if summary.errors_fixed > 0:
         n = summary.errors_fixed
-        if twitter_style == "devlog":
-            posts['short'].append(f"devlog: fixed {n} {_plural(n, 'bug')}")
-        elif twitter_style == "minimal":
-            posts['short'].append(f"Fixed {n} {_plural(n, 'bug')}")
-        else:
-            posts['short'].append(
-                f"🐛➡️✅ Squashed {n} bug{'s' if n > 1 else ''} today!\n\nThe best feeling in coding."
-            )
+        posts['short'].append(tw_tpl['bugs'].format(n=n, noun=_plural(n, 'bug')))
 
     if summary.duration_minutes > 0:
-        t = _time_str(summary.duration_minutes)
-        if twitter_style == "devlog":
-            posts['short'].append(f"devlog: {t} in the trenches ({summary.total_tool_calls} ops)")
-        elif twitter_style == "minimal":
-            posts['short'].append(f"{t} of focused coding ({summary.total_tool_calls} ops)")
-        else:
-            posts['short'].append(
-                f"⏱️ {t} of focused coding\n\n{summary.total_tool_calls} operations later... progress!"
-            )
-    
+        posts['short'].append(tw_tpl['time'].format(
+            t=_time_str(summary.duration_minutes), ops=summary.total_tool_calls
+        ))
+
     # Thread posts (X/Twitter - compelling hooks, NO hashtags)
     thread = []
 
@@ -398,55 +581,38 @@ def generate_posts(
         hook_options = []
 
         if summary.git_commits:
-            commit_preview = summary.git_commits[0][:100]
-            if twitter_style == "devlog":
-                hook_options.append(f"devlog: Just shipped {commit_preview}\n\nHere's what went into this 🧵")
-            else:
-                hook_options.append(f"Just shipped: {commit_preview}\n\nThread on how it came together 👇")
+            hook_options.append(tw_tpl['hook_commit'].format(msg=summary.git_commits[0][:100]))
 
         if summary.files_created and len(summary.files_created) >= 3:
             count = len(summary.files_created)
-            langs = ', '.join(sorted(list(summary.languages_used))[:2]) if summary.languages_used else 'code'
-            if twitter_style == "devlog":
-                hook_options.append(f"devlog: Created {count} new files today\n\n{langs} - building in public 🧵")
-            else:
-                hook_options.append(f"Built {count} new files today in {langs}\n\nBreakdown 👇")
+            langs = ', '.join(sorted_langs[:2]) if sorted_langs else 'code'
+            hook_options.append(tw_tpl['hook_files'].format(n=count, langs=langs))
 
         if summary.errors_fixed >= 2:
-            n = summary.errors_fixed
-            if twitter_style == "devlog":
-                hook_options.append(f"devlog: Squashed {n} bugs in today's session\n\nThe debugging journey 🧵")
-            else:
-                hook_options.append(f"Fixed {n} bugs today\n\nWhat I learned 👇")
+            hook_options.append(tw_tpl['hook_bugs'].format(n=summary.errors_fixed))
 
         # If we have a project with tech stack, use that
         if summary.languages_used and summary.duration_minutes > 15:
-            langs = ', '.join(sorted(list(summary.languages_used))[:3])
-            time_str = _time_str(summary.duration_minutes)
-            if twitter_style == "devlog":
-                hook_options.append(f"devlog: {time_str} deep in {langs}\n\nSession recap 🧵")
-            else:
-                hook_options.append(f"{time_str} building with {langs}\n\nWhat I shipped 👇")
+            hook_options.append(tw_tpl['hook_stack'].format(
+                t=_time_str(summary.duration_minutes), langs=', '.join(sorted_langs[:3])
+            ))
 
         # Use the first available hook, or create a minimal one
         if hook_options:
             thread.append(hook_options[0])
         else:
             # Fallback for light sessions
-            project = summary.project_name or "my project"
-            if twitter_style == "devlog":
-                thread.append(f"devlog: Working on {project}\n\nProgress update 🧵")
-            else:
-                thread.append(f"Quick session on {project}\n\nWhat changed 👇")
+            thread.append(tw_tpl['hook_fallback'].format(project=summary.project_name or "my project"))
 
         # Tweet 2: Tech stack (if available)
         if summary.languages_used:
-            langs = ', '.join(sorted(list(summary.languages_used))[:4])
+            langs = ', '.join(sorted_langs[:4])
             thread.append(f"💻 Tech stack: {langs}")
 
         # Tweet 3: Files created (if any)
         if summary.files_created:
-            file_list = '\n'.join(f"  • {Path(f).name}" for f in summary.files_created[:5])
+            # Already basenames via safe_display_path - no Path() needed
+            file_list = '\n'.join(f"  • {f}" for f in summary.files_created[:5])
             thread.append(f"📝 New files:\n{file_list}")
 
         # Tweet 4: Commits (if any)
@@ -470,7 +636,7 @@ def generate_posts(
     
     # Medium posts (LinkedIn)
     project = summary.project_name or 'my project'
-    langs = ', '.join(sorted(list(summary.languages_used))[:3])
+    langs = ', '.join(sorted_langs[:3])
     time_str = _time_str(summary.duration_minutes)
     first_commit = summary.git_commits[0][:100] if summary.git_commits else ""
 
@@ -501,13 +667,11 @@ def generate_posts(
                 out.append(s)
         return out
 
+    # Intro candidates depend on which session facts exist, so they
+    # stay per-style code; headlines and body layout come from the
+    # template table and render through one shared loop below.
+    intro_options = []
     if linkedin_style == "story":
-        headline_options = [
-            "A small win (and a lesson)",
-            "A quick story from today’s build",
-            "One of those satisfying sessions",
-        ]
-        intro_options = []
         if summary.errors_fixed:
             intro_options.append(f"Started with a few errors in {project} and ended with a cleaner build.")
         if summary.tests_run:
@@ -517,27 +681,7 @@ def generate_posts(
         if langs:
             intro_options.append(f"Worked through a set of improvements in {project} ({langs}).")
         intro_options.append(f"Another step forward on {project}.")
-        intros = _dedupe(intro_options)
-
-        for i, intro in enumerate(intros[:3], 1):
-            headline = headline_options[(i - 1) % len(headline_options)]
-            medium_post = f"""{headline}
-
-{intro}
-
-What changed:
-{bullets_block}
-
-Curious what you’re building right now — what’s on your plate this week?
-
-{linkedin_hashtags}"""
-            posts['medium'].append(medium_post)
     elif linkedin_style == "wins":
-        headline_options = [
-            "Progress, in numbers",
-            "Session snapshot",
-            "Quick status update",
-        ]
         metrics = []
         if time_str:
             metrics.append(time_str)
@@ -551,7 +695,6 @@ Curious what you’re building right now — what’s on your plate this week?
             metrics.append("tests run ✅")
         metrics_line = " • ".join(metrics) if metrics else ""
 
-        intro_options = []
         if metrics_line:
             intro_options.append(f"{project} — {metrics_line}.")
         if first_commit:
@@ -559,27 +702,7 @@ Curious what you’re building right now — what’s on your plate this week?
         if langs:
             intro_options.append(f"{project} + {langs} + consistent iteration.")
         intro_options.append(f"Keeping momentum on {project}.")
-        intros = _dedupe(intro_options)
-
-        for i, intro in enumerate(intros[:3], 1):
-            headline = headline_options[(i - 1) % len(headline_options)]
-            medium_post = f"""{headline}
-
-{intro}
-
-Highlights:
-{bullets_block}
-
-{linkedin_hashtags}"""
-            posts['medium'].append(medium_post)
     else:  # professional (default)
-        headline_options = [
-            "Build update",
-            "Progress update",
-            "Product update",
-            "Engineering update",
-        ]
-        intro_options = []
         if first_commit:
             intro_options.append(f"Quick update on {project}: shipped “{first_commit}”.")
             intro_options.append(f"{project} update — shipped “{first_commit}”.")
@@ -588,52 +711,57 @@ Highlights:
         if time_str:
             intro_options.append(f"{time_str} of focused work on {project}.")
         intro_options.append(f"Incremental improvements to {project} — moving it forward.")
-        intros = _dedupe(intro_options)
 
-        for i, intro in enumerate(intros[:3], 1):
-            headline = headline_options[(i - 1) % len(headline_options)]
-            medium_post = f"""{headline}
-
-{intro}
-
-Key outcomes:
-{bullets_block}
+    li_tpl = _LINKEDIN_TEMPLATES.get(linkedin_style, _LINKEDIN_TEMPLATES['professional'])
+    headline_options = li_tpl['headlines']
+    for i, intro in enumerate(_dedupe(intro_options)[:3], 1):
+        headline = headline_options[(i - 1) % len(headline_options)]
+        posts['medium'].append(li_tpl['body'].format(
+            headline=headline,
+            intro=intro,
+            bullets=bullets_block,
+            hashtags=linkedin_hashtags,
+        ))
 
-What are you building this week?
+    # Long form (Instagram caption / blog) - skip for empty sessions,
+    # same bar as the thread
+    if not has_content:
+        return posts
 
-{linkedin_hashtags}"""
-            posts['medium'].append(medium_post)
-    
-    # Long form (Instagram caption / blog)
-    long_post = f"""Today's build session 🛠️
+    # Fragments + one join, same as format_output - += on a growing
+    # string recopies the accumulator per highlight
+    long_parts = [f"""Today's build session 🛠️
 
 {summary.duration_minutes} minutes of focused coding on {summary.project_name or 'my project'}.
 
 The journey:
-"""
-    
+"""]
+
     for highlight in summary.highlights[:5]:
-        emoji = {'feature': '✨', 'fix': '🐛', 'test': '🧪', 'milestone': '🎯', 'refactor': '♻️', 'docs': '📚'}.get(highlight.category, '•')
-        long_post += f"{emoji} {highlight.description}\n"
-    
+        emoji = _CATEGORY_EMOJI.get(highlight.category, '•')
+        long_parts.append(f"{emoji} {highlight.description}\n")
+
     if summary.languages_used:
-        long_post += f"\nTech: {', '.join(sorted(summary.languages_used))}\n"
-    
-    long_post += f"""
+        long_parts.append(f"\nTech: {', '.join(sorted_langs)}\n")
+
+    long_parts.append(f"""
 Building in public means sharing the journey - the wins, the bugs, and everything in between.
 
 What's your current project? Drop a comment! 👇
 
 {' '.join(hashtags)}
-"""
-    posts['long'].append(long_post)
+""")
+    posts['long'].append(''.join(long_parts))
     
     return posts
 
 
 def format_output(posts: dict, summary: SessionSummary) -> str:
     """Format posts into a readable markdown document"""
-    output = f"""# Build in Public - Session Posts
+    # Collect fragments and join once at the end - repeated += on a
+    # growing string recopies the whole accumulator every time
+    parts: List[str] = []
+    parts.append(f"""# Build in Public - Session Posts
 
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 Session: {summary.session_id}
@@ -647,50 +775,50 @@ Languages: {', '.join(sorted(summary.languages_used)) or 'N/A'}
 
 *Note: Hashtags removed per Elon's guidance - they look spammy on X*
 
-"""
+""")
 
     for i, post in enumerate(posts['short'], 1):
         char_count = len(post)
-        output += f"### Option {i} ({char_count} chars)\n\n```\n{post}\n```\n\n"
+        parts.append(f"### Option {i} ({char_count} chars)\n\n```\n{post}\n```\n\n")
 
-    output += """---
+    parts.append("""---
 
 ## 🧵 Thread (Twitter/X - No hashtags, compelling hooks)
 
 *Note: First tweet designed as a hook to drive engagement*
 
-"""
+""")
 
     if posts['thread']:
         for i, tweet in enumerate(posts['thread'], 1):
             char_count = len(tweet)
-            output += f"**{i}/{len(posts['thread'])}** ({char_count} chars)\n\n```\n{tweet}\n```\n\n"
+            parts.append(f"**{i}/{len(posts['thread'])}** ({char_count} chars)\n\n```\n{tweet}\n```\n\n")
     else:
-        output += "*No thread generated - insufficient content for engaging thread*\n\n"
-    
-    output += """---
+        parts.append("*No thread generated - insufficient content for engaging thread*\n\n")
+
+    parts.append("""---
 
 ## 💼 Medium Posts (LinkedIn, Mastodon - With hashtags)
 
 *Note: Hashtags work well on LinkedIn and Mastodon for discoverability*
 
-"""
-    
+""")
+
     for i, post in enumerate(posts['medium'], 1):
-        output += f"### Option {i}\n\n```\n{post}\n```\n\n"
-    
-    output += """---
+        parts.append(f"### Option {i}\n\n```\n{post}\n```\n\n")
+
+    parts.append("""---
 
 ## 📸 Long Form (Instagram, Blog - With hashtags)
 
 *Note: Instagram posts can use up to 30 hashtags for maximum reach*
 
-"""
-    
+""")
+
     for i, post in enumerate(posts['long'], 1):
-        output += f"### Option {i}\n\n```\n{post}\n```\n\n"
-    
-    output += f"""---
+        parts.append(f"### Option {i}\n\n```\n{post}\n```\n\n")
+
+    parts.append(f"""---
 
 ## #️⃣ Hashtags
 
@@ -709,19 +837,66 @@ Copy these: `{' '.join(posts['hashtags'])}`
 | Tests Run | {'Yes' if summary.tests_run else 'No'} |
 | Total Operations | {summary.total_tool_calls} |
 
-"""
-    
+""")
+
     if summary.files_created:
-        output += "\n### Files Created\n\n"
+        parts.append("\n### Files Created\n\n")
         for f in summary.files_created[:10]:
-            output += f"- `{safe_display_path(f)}`\n"
-    
+            parts.append(f"- `{safe_display_path(f)}`\n")
+
     if summary.git_commits:
-        output += "\n### Commits\n\n"
+        parts.append("\n### Commits\n\n")
         for c in summary.git_commits:
-            output += f"- {c}\n"
-    
-    return output
+            parts.append(f"- {c}\n")
+
+    return ''.join(parts)
+
+
+def _summarize_session(session_path: str) -> Tuple[str, SessionSummary]:
+    """Pool worker for --all: parse and summarize one session file."""
+    return session_path, extract_highlights(iter_session_jsonl(Path(session_path)))
+
+
+def generate_all_sessions(args) -> None:
+    """Generate posts for every session file, summarizing in parallel.
+
+    Session parsing is CPU-bound JSON decoding with no shared state, so
+    a process pool scales it across cores; post generation and output
+    writing stay in the parent as results stream back.
+    """
+    import multiprocessing
+
+    sessions = _list_all_sessions()
+    if not sessions:
+        print("Error: No session files found", file=sys.stderr)
+        sys.exit(1)
+
+    project_names = dict(sessions)
+
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"📖 Summarizing {len(sessions)} session(s)...", file=sys.stderr)
+
+    # chunksize amortizes IPC; maxtasksperchild caps worker memory
+    # growth across very large batches
+    with multiprocessing.Pool(processes=os.cpu_count(), maxtasksperchild=8) as pool:
+        for session_path, summary in pool.imap_unordered(
+            _summarize_session, project_names, chunksize=4
+        ):
+            summary.session_id = Path(session_path).stem
+            summary.project_name = safe_project_name(
+                project_names[session_path], fallback=args.project_name
+            )
+            posts = generate_posts(
+                summary,
+                twitter_style=args.twitter_style,
+                linkedin_style=args.linkedin_style,
+            )
+            output_file = output_dir / f"build-in-public_{summary.session_id}.md"
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(format_output(posts, summary))
+            print(f"✅ {summary.session_id}: {output_file}", file=sys.stderr)
 
 
 def main():
@@ -731,6 +906,8 @@ def main():
     parser.add_argument('--session', '-s', help='Session ID or path to JSONL file')
     parser.add_argument('session_spec', nargs='?', help='Session ID or path to JSONL file (positional)')
     parser.add_argument('--output', '-o', default='.', help='Output directory')
+    parser.add_argument('--all', action='store_true',
+                        help='Generate posts for every session (markdown only, one file per session)')
     parser.add_argument('--json', action='store_true', help='Also output raw JSON')
     parser.add_argument('--project-name', help='Override project name (privacy-safe)')
     parser.add_argument(
@@ -747,7 +924,15 @@ def main():
     )
     
     args = parser.parse_args()
-    
+
+    # Batch mode: every session, in parallel
+    if args.all:
+        if args.session or args.session_spec:
+            print("Error: --all cannot be combined with a session", file=sys.stderr)
+            sys.exit(1)
+        generate_all_sessions(args)
+        return
+
     # Find session file
     session_spec = args.session or args.session_spec
     if session_spec:
@@ -776,9 +961,8 @@ def main():
     print(f"📖 Parsing session: {session_id}", file=sys.stderr)
     print(f"📁 Project: {project_name}", file=sys.stderr)
     
-    # Parse and analyze
-    messages = parse_session_jsonl(session_path)
-    summary = extract_highlights(messages)
+    # Parse and analyze (streamed - the transcript is never fully in memory)
+    summary = extract_highlights(iter_session_jsonl(session_path))
     summary.session_id = session_id
     summary.project_name = project_name
     
@@ -806,27 +990,34 @@ def main():
     
     if args.json:
         json_file = output_dir / f"build-in-public_{timestamp}.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'summary': {
-                    'session_id': summary.session_id,
-                    'project_name': summary.project_name,
-                    'duration_minutes': summary.duration_minutes,
-                    'styles': {
-                        'twitter': args.twitter_style,
-                        'linkedin': args.linkedin_style,
-                    },
-                    # Keep filenames privacy-safe (no absolute paths).
-                    'files_created': [safe_display_path(p) for p in summary.files_created],
-                    'files_modified': [safe_display_path(p) for p in summary.files_modified],
-                    'git_commits': summary.git_commits,
-                    'errors_fixed': summary.errors_fixed,
-                    'tests_run': summary.tests_run,
-                    'languages_used': sorted(list(summary.languages_used)),
-                    'total_tool_calls': summary.total_tool_calls
+        payload = {
+            'summary': {
+                'session_id': summary.session_id,
+                'project_name': summary.project_name,
+                'duration_minutes': summary.duration_minutes,
+                'styles': {
+                    'twitter': args.twitter_style,
+                    'linkedin': args.linkedin_style,
                 },
-                'posts': posts
-            }, f, indent=2)
+                # Keep filenames privacy-safe (no absolute paths).
+                'files_created': [safe_display_path(p) for p in summary.files_created],
+                'files_modified': [safe_display_path(p) for p in summary.files_modified],
+                'git_commits': summary.git_commits,
+                'errors_fixed': summary.errors_fixed,
+                'tests_run': summary.tests_run,
+                'languages_used': sorted(list(summary.languages_used)),
+                'total_tool_calls': summary.total_tool_calls
+            },
+            'posts': posts
+        }
+        if _json is json:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=2)
+        else:
+            # orjson serializes straight to UTF-8 bytes, much faster on
+            # emoji-heavy post content
+            with open(json_file, 'wb') as f:
+                f.write(_json.dumps(payload, option=_json.OPT_INDENT_2))
         print(f"📄 JSON output: {json_file}", file=sys.stderr)
     
     # Also print the markdown to stdout for piping
@@ -6,55 +6,101 @@ This hook fires when a Claude Code session ends and reminds the user
 to generate their #BuildingInPublic posts.
 """
 
-import json
+import mmap
 import sys
 import os
-from pathlib import Path
-from datetime import datetime
+
+try:
+    # Optional fast JSON parser; stdlib json is the fallback so the
+    # hook never gains a hard dependency. Importing it only on the
+    # fallback path keeps orjson users from paying for both modules
+    # at every session end.
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Reminder banner, pre-encoded once at import. Emitting it with a
+# single os.write skips eight print() round-trips through the stdout
+# TextIOWrapper's lock/encode/flush cycle.
+_BANNER = (
+    '\n' + '=' * 50 +
+    '\n📱 BUILD IN PUBLIC REMINDER\n' +
+    '=' * 50 +
+    '\n\nYou had a productive session! Consider sharing your progress.\n'
+    '\nRun /build-in-public:generate to create social media posts\n'
+    'for Twitter/X, BlueSky, LinkedIn, and more.\n\n' +
+    '=' * 50 + '\n'
+).encode('utf-8')
 
 
 def main():
-    # Read hook input from stdin
+    # Read hook input from stdin as raw bytes - skips the
+    # TextIOWrapper decode step, and both parsers accept bytes
     try:
-        hook_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        raw = sys.stdin.buffer.read()
+        hook_data = _json.loads(raw) if raw else {}
+    except ValueError:
         hook_data = {}
-    
-    # Check if this was a substantial session
-    session_id = hook_data.get('session_id', '')
-    
-    # Get the activity log to see if there was meaningful work
-    plugin_root = os.environ.get('CLAUDE_PLUGIN_ROOT', '')
-    activity_log = Path(plugin_root) / '.session_activity.json' if plugin_root else None
-    
+
+    # Without a plugin root there is no activity log and no reminder
+    # to show - bail before any path or file work
+    plugin_root = os.environ.get('CLAUDE_PLUGIN_ROOT')
+    if not plugin_root:
+        sys.exit(0)
+
+    activity_log = os.path.join(plugin_root, '.session_activity.log')
+
     has_activity = False
-    if activity_log and activity_log.exists():
+    try:
+        # Open-then-unlink: the inode stays readable through the fd
+        # after the unlink, so the log is consumed and cleaned up in
+        # one pass with no trailing stat+unlink pair - and cleanup
+        # still happens if the hook crashes mid-read.
+        fd = os.open(activity_log, os.O_RDONLY)
         try:
-            with open(activity_log, 'r') as f:
-                activity = json.load(f)
-                # Consider it substantial if there were file edits or commits
-                has_activity = (
-                    activity.get('files_modified', 0) > 0 or
-                    activity.get('files_created', 0) > 0 or
-                    activity.get('git_commits', 0) > 0
-                )
-        except:
-            pass
+            os.unlink(activity_log)
+            # The activity logger appends one delta record per
+            # response; sum them here to get the session totals.
+            # The log is memory-mapped so each delta line is sliced
+            # straight out of the kernel's page cache instead of
+            # going through a buffered read() copy.
+            try:
+                mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                mm = None  # an empty log can't be mapped - no activity
+        finally:
+            os.close(fd)
+        activity = {}
+        if mm is not None:
+            with mm:
+                size = len(mm)
+                pos = 0
+                while pos < size:
+                    nl = mm.find(b'\n', pos)
+                    end = size if nl < 0 else nl
+                    line = mm[pos:end]
+                    pos = end + 1
+                    try:
+                        delta = _json.loads(line)
+                    except ValueError:
+                        continue
+                    for key, value in delta.items():
+                        activity[key] = activity.get(key, 0) + value
+        # Consider it substantial if there were file edits or commits
+        has_activity = (
+            activity.get('files_modified', 0) > 0 or
+            activity.get('files_created', 0) > 0 or
+            activity.get('git_commits', 0) > 0
+        )
+    except (OSError, ValueError):
+        # Missing/unreadable log or a corrupt record - treat the
+        # session as having no activity rather than blocking exit
+        pass
     
     if has_activity:
-        # Print reminder message (will be shown to user)
-        print("\n" + "=" * 50)
-        print("📱 BUILD IN PUBLIC REMINDER")
-        print("=" * 50)
-        print("\nYou had a productive session! Consider sharing your progress.")
-        print("\nRun /build-in-public:generate to create social media posts")
-        print("for Twitter/X, BlueSky, LinkedIn, and more.")
-        print("\n" + "=" * 50)
-    
-    # Clean up activity log for next session
-    if activity_log and activity_log.exists():
-        activity_log.unlink()
-    
+        # Show reminder message to the user - one write, one syscall
+        os.write(1, _BANNER)
+
     # Always exit successfully
     sys.exit(0)
 